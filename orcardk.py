@@ -7,36 +7,31 @@ making it easier to maintain context and generate effective prompts for
 AI assistants.
 """
 
-import argparse
+import json
 import os
-import datetime
 import re
 import sys
 from pathlib import Path
 
 VERSION = "0.1.0"
 
-class RecursiveDevKit:
-    """Main class for managing the RecursiveDevKit framework."""
-    
-    def __init__(self, project_dir="."):
-        """Initialize the tool with project directory."""
-        self.project_dir = project_dir
-        self.context_file = os.path.join(project_dir, "project-context.md")
-        self.state_file = os.path.join(project_dir, "development-state.md")
-        self.prompt_file = os.path.join(project_dir, "prompt-template.md")
-    
-    def init(self, project_name, description, phases="3", initial_phase="Initialization"):
-        """Initialize a new project with the framework files."""
-        # Check if files already exist
-        if os.path.exists(self.context_file) or os.path.exists(self.state_file) or os.path.exists(self.prompt_file):
-            confirm = input("Framework files already exist. Overwrite? (y/n): ")
-            if confirm.lower() != "y":
-                print("Initialization canceled.")
-                return
-        
-        # Create project-context.md
-        context = f"""# Project Context
+# Precompiled section splitter, compiled once at module level so each call
+# reuses it without probing re's internal cache.
+_RE_SECTIONS = re.compile(r"^## ([^\n]+)\n(.*?)(?=^## |\Z)", re.MULTILINE | re.DOTALL)
+
+# Field anchors shared by the parsers and updaters. sys.intern keeps each a
+# single object so prefix comparisons hit CPython's pointer-equality fast path.
+_TASK_PREFIX = sys.intern("- CURRENT TASK: ")
+_CRITERIA_PREFIX = sys.intern("- COMPLETION CRITERIA: ")
+_FILES_PREFIX = sys.intern("- WORKING FILES: ")
+_INTEGRATION_PREFIX = sys.intern("- INTEGRATION POINTS: ")
+_PHASE_HEADER = sys.intern("Current Phase: ")
+_PHASE_PREFIX = sys.intern("## Current Phase: ")
+_PROGRESS_PREFIX = sys.intern("Progress: ")
+_COMPLETED_HEADER = sys.intern("## Completed")
+
+# File templates, parsed once at import time and rendered with format_map.
+_CONTEXT_TEMPLATE = """# Project Context
 
 ## Definition
 {description}
@@ -64,9 +59,8 @@ Progress: 0% complete
 - Good performance
 - Proper error handling
 """
-        
-        # Create development-state.md
-        state = """# Development State
+
+_STATE_TEMPLATE = """# Development State
 
 ## High Priority
 - CURRENT TASK: Initialize project structure
@@ -93,30 +87,37 @@ Progress: 0% complete
   - Rationale: Structured approach to AI-assisted development
   - Alternatives: Ad-hoc prompting, traditional development
 """
-        
-        # Create prompt-template.md
-        prompt = f"""Continue developing {project_name} focusing on the following task:
 
-## Current Focus
-- Task: Initialize project structure
-- Files: Initial repository setup
-- Integration points: None yet
-- Completion criteria: Repository structure and base files created
+# init writes the state template verbatim, so encode it once at import time
+_STATE_TEMPLATE_BYTES = _STATE_TEMPLATE.encode("utf-8")
 
-## Project Context
-- Project: {project_name} - {description}
-- Current phase: 1/{phases} - {initial_phase}
-- Progress: 0% complete
-- Key architecture: Initial implementation pending
-- Development principles: Modularity, Testability, Maintainability
+_RESET_STATE_TEMPLATE = """# Development State
 
-## Current State
-- Completed: Framework initialization
-- Next tasks: Define initial architecture, Set up core components
-- Challenges: None yet
-- Recent decisions: Using RecursiveDevKit framework for development
+## High Priority
+- CURRENT TASK: Initialize phase
+- COMPLETION CRITERIA: Phase initialization complete
+- WORKING FILES: Initial phase files
+- INTEGRATION POINTS: None yet
+
+## Completed
+- Previous phase completion
 
-## Implementation Requirements
+## Next Tasks
+1. First task in new phase
+   - Files: To be determined
+   - Integration: To be determined
+
+## Challenges
+- None yet
+
+## Decisions
+- Phase transition
+  - Rationale: Previous phase completed
+  - Alternatives: Continue previous phase
+"""
+
+# Shared tail of both prompt flavors
+_PROMPT_REQUIREMENTS = """## Implementation Requirements
 1. The implementation should follow the project's development principles
 2. Code should be properly documented with comments
 3. Handle edge cases and potential errors
@@ -141,20 +142,184 @@ Please provide:
    - Edge cases to test
    - Integration test approach if applicable
 """
+
+_INIT_PROMPT_TEMPLATE = """Continue developing {project_name} focusing on the following task:
+
+## Current Focus
+- Task: Initialize project structure
+- Files: Initial repository setup
+- Integration points: None yet
+- Completion criteria: Repository structure and base files created
+
+## Project Context
+- Project: {project_name} - {description}
+- Current phase: 1/{phases} - {initial_phase}
+- Progress: 0% complete
+- Key architecture: Initial implementation pending
+- Development principles: Modularity, Testability, Maintainability
+
+## Current State
+- Completed: Framework initialization
+- Next tasks: Define initial architecture, Set up core components
+- Challenges: None yet
+- Recent decisions: Using RecursiveDevKit framework for development
+
+""" + _PROMPT_REQUIREMENTS
+
+_PROMPT_TEMPLATE = """Continue developing the project focusing on the following task:
+
+## Current Focus
+- Task: {current_task}
+- Files: {working_files}
+- Integration points: {integration_points}
+- Completion criteria: {completion_criteria}
+
+## Project Context
+- Project: {project_info}
+- Current phase: {phase_info}
+- Progress: {progress}% complete
+- Key architecture: {arch_info}
+- Development principles: {principles_info}
+
+## Current State
+- Completed: {completed_info}
+- Next tasks: {next_info}
+- Challenges: {challenge_info}
+- Recent decisions: {decision_info}
+
+""" + _PROMPT_REQUIREMENTS
+
+
+def _split_sections(text):
+    """Split a framework markdown file into a {header: body} dict in one pass."""
+    return dict(_RE_SECTIONS.findall(text))
+
+
+def _strip_numbered(line):
+    """Return the task text of a "N. task" line, or None if it isn't one.
+
+    Pure character checks; the bounded find also caps the scan on long
+    malformed lines.
+    """
+    if len(line) >= 3 and line[0].isdigit():
+        dot = line.find(". ", 1, 5)
+        if dot > 0 and line[:dot].isdigit():
+            return line[dot + 2:].strip()
+    return None
+
+
+def _parse_bullets(section_body):
+    """Extract top-level "- " bullet texts from a section body."""
+    return [line[2:].strip() for line in section_body.splitlines() if line.startswith("- ")]
+
+
+def _parse_bullet_names(section_body):
+    """Extract top-level "- " bullet names, dropping any ": detail" suffix."""
+    return [
+        line[2:].partition(":")[0].strip()
+        for line in section_body.splitlines()
+        if line.startswith("- ")
+    ]
+
+
+def _read_file(path):
+    """Read a whole file with a single stat + read syscall pair."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        if len(data) < size:  # short reads are possible in theory
+            parts = [data]
+            read = len(data)
+            while read < size:
+                chunk = os.read(fd, size - read)
+                if not chunk:
+                    break
+                parts.append(chunk)
+                read += len(chunk)
+            data = b"".join(parts)
+        return data.decode("utf-8")
+    finally:
+        os.close(fd)
+
+
+def _write_file(path, content):
+    """Write a whole file with a single open/write/close syscall triple.
+
+    Accepts str or pre-encoded bytes; bytes skip the UTF-8 codec pass.
+    """
+    data = content if isinstance(content, bytes) else content.encode("utf-8")
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        written = os.write(fd, data)
+        while written < len(data):  # short writes are possible in theory
+            written += os.write(fd, data[written:])
+    finally:
+        os.close(fd)
+
+
+def _replace_line(content, prefix, new_value):
+    """Overwrite the value of the first line starting with prefix."""
+    idx = content.find(prefix)
+    if idx == -1:
+        return content
+    end = content.find("\n", idx)
+    if end == -1:
+        end = len(content)
+    return "".join((content[:idx], prefix, new_value, content[end:]))
+
+class RecursiveDevKit:
+    """Main class for managing the RecursiveDevKit framework."""
+
+    CONTEXT_NAME = "project-context.md"
+    STATE_NAME = "development-state.md"
+    PROMPT_NAME = "prompt-template.md"
+    CACHE_NAME = ".orcardk-cache.json"
+
+    def __init__(self, project_dir="."):
+        """Initialize the tool with project directory."""
+        self.project_dir = Path(project_dir)
+        self.context_file = self.project_dir / self.CONTEXT_NAME
+        self.state_file = self.project_dir / self.STATE_NAME
+        self.prompt_file = self.project_dir / self.PROMPT_NAME
+        self.cache_file = self.project_dir / self.CACHE_NAME
+
+    def init(self, project_name, description, phases="3", initial_phase="Initialization"):
+        """Initialize a new project with the framework files."""
+        # Check if files already exist (one directory listing, not three stats)
+        have_dir = self.project_dir.is_dir()
+        existing = set(os.listdir(self.project_dir)) if have_dir else set()
+        if {self.CONTEXT_NAME, self.STATE_NAME, self.PROMPT_NAME} & existing:
+            confirm = input("Framework files already exist. Overwrite? (y/n): ")
+            if confirm.lower() != "y":
+                print("Initialization canceled.")
+                return
         
+        # Render the three framework files from the module-level templates
+        fields = {
+            "project_name": project_name,
+            "description": description,
+            "phases": phases,
+            "initial_phase": initial_phase,
+        }
+        context = _CONTEXT_TEMPLATE.format_map(fields)
+        state = _STATE_TEMPLATE_BYTES
+        prompt = _INIT_PROMPT_TEMPLATE.format_map(fields)
+
+
         # Create directory if it doesn't exist
-        os.makedirs(self.project_dir, exist_ok=True)
-        
+        if not have_dir:
+            os.makedirs(self.project_dir, exist_ok=True)
+
         # Write files
-        with open(self.context_file, "w") as f:
-            f.write(context)
-        
-        with open(self.state_file, "w") as f:
-            f.write(state)
-        
-        with open(self.prompt_file, "w") as f:
-            f.write(prompt)
-        
+        files_to_write = [
+            (self.context_file, context),
+            (self.state_file, state),
+            (self.prompt_file, prompt),
+        ]
+        for path, content in files_to_write:
+            _write_file(path, content)
+
         print(f"✅ Initialized {project_name} with RecursiveDevKit framework")
         print(f"   Created: {self.context_file}")
         print(f"   Created: {self.state_file}")
@@ -162,175 +327,153 @@ Please provide:
     
     def update_prompt(self, custom_focus=None):
         """Generate a new prompt based on current context and state."""
-        # Check if files exist
-        if not os.path.exists(self.context_file) or not os.path.exists(self.state_file):
+        # Stat both inputs (doubles as the existence check)
+        try:
+            ctx_stat = os.stat(self.context_file)
+            state_stat = os.stat(self.state_file)
+        except OSError:
             print("⚠️  Error: Context or state file not found. Run 'init' first.")
             return
+
+        # Skip the parse and write entirely when nothing changed since the
+        # last run (custom focus always forces a regeneration)
+        cache_key = {
+            "ctx_mtime_ns": ctx_stat.st_mtime_ns,
+            "ctx_size": ctx_stat.st_size,
+            "state_mtime_ns": state_stat.st_mtime_ns,
+            "state_size": state_stat.st_size,
+        }
+        if custom_focus is None:
+            try:
+                cached = json.loads(_read_file(self.cache_file))
+            except (OSError, ValueError):
+                cached = None
+            if cached == cache_key and self.prompt_file.exists():
+                print("✅ Prompt already up to date")
+                print(f"   Prompt saved to {self.prompt_file}")
+                return
+
+        # Read both input files
+        context = _read_file(self.context_file)
+        state = _read_file(self.state_file)
         
-        # Read context file
-        with open(self.context_file, "r") as f:
-            context = f.read()
-        
-        # Read state file
-        with open(self.state_file, "r") as f:
-            state = f.read()
-        
+        # Split each file into its "## Section" blocks in a single pass
+        context_sections = _split_sections(context)
+        state_sections = _split_sections(state)
+
         # Extract project name and description
         project_info = "Project"  # Default
         project_name = "Project"
         project_desc = ""
-        
+
         # Extract from context file
-        definition_match = re.search(r"## Definition\n(.*?)(?=\n##|\Z)", context, re.DOTALL)
-        if definition_match:
-            project_desc = definition_match.group(1).strip()
+        definition = context_sections.get("Definition")
+        if definition:
+            project_desc = definition.strip()
             project_info = f"{project_name} - {project_desc}"
-        
-        # Extract phase info
+
+        # Extract phase info (the header itself carries the phase)
         phase_info = "Current phase"
-        phase_match = re.search(r"## Current Phase: (.*?)\nProgress: (.*?)%", context, re.DOTALL)
-        if phase_match:
-            phase_info = f"{phase_match.group(1).strip()}"
-            progress = f"{phase_match.group(2).strip()}"
-        
+        progress = "0"
+        for header in context_sections:
+            if header.startswith(_PHASE_HEADER):
+                phase_info = header[len(_PHASE_HEADER):].strip()
+                for line in context_sections[header].splitlines():
+                    if line.startswith(_PROGRESS_PREFIX) and "%" in line:
+                        progress = line[len(_PROGRESS_PREFIX):line.index("%")].strip()
+                        break
+                break
+
         # Extract architecture
         arch_info = "Initial architecture"
-        arch_match = re.search(r"## Architecture\n(.*?)(?=\n##|\Z)", context, re.DOTALL)
-        if arch_match:
-            arch_components = []
-            for line in arch_match.group(1).strip().split("\n"):
-                if line.startswith("- "):
-                    arch_components.append(line[2:].strip())
-            arch_info = ", ".join(arch_components)
-        
+        arch_section = context_sections.get("Architecture")
+        if arch_section:
+            arch_info = ", ".join(_parse_bullets(arch_section))
+
         # Extract principles
         principles_info = "Modularity, Maintainability"
-        principles_match = re.search(r"## Development Principles\n(.*?)(?=\n##|\Z)", context, re.DOTALL)
-        if principles_match:
-            principles = []
-            for line in principles_match.group(1).strip().split("\n"):
-                if line.startswith("- "):
-                    principle_name = line[2:].split(":")[0].strip()
-                    principles.append(principle_name)
-            principles_info = ", ".join(principles)
-        
-        # Extract current task
+        principles_section = context_sections.get("Development Principles")
+        if principles_section:
+            principles_info = ", ".join(_parse_bullet_names(principles_section))
+
+        # Extract the High Priority fields by scanning its lines once
         current_task = "implementation"  # Default
-        if custom_focus:
-            current_task = custom_focus
-        else:
-            task_match = re.search(r"- CURRENT TASK: (.*?)(?=\n|-|\Z)", state, re.DOTALL)
-            if task_match:
-                current_task = task_match.group(1).strip()
-        
-        # Extract completion criteria
         completion_criteria = "Task complete"
-        criteria_match = re.search(r"- COMPLETION CRITERIA: (.*?)(?=\n|-|\Z)", state, re.DOTALL)
-        if criteria_match:
-            completion_criteria = criteria_match.group(1).strip()
-        
-        # Extract working files
         working_files = "relevant files"
-        files_match = re.search(r"- WORKING FILES: (.*?)(?=\n|-|\Z)", state, re.DOTALL)
-        if files_match:
-            working_files = files_match.group(1).strip()
-        
-        # Extract integration points
         integration_points = "related components"
-        integration_match = re.search(r"- INTEGRATION POINTS: (.*?)(?=\n|-|\Z)", state, re.DOTALL)
-        if integration_match:
-            integration_points = integration_match.group(1).strip()
-        
+        priority_section = state_sections.get("High Priority", "")
+        startswith = str.startswith  # local binding skips per-line lookups
+        for line in priority_section.split("\n"):
+            if startswith(line, _TASK_PREFIX):
+                current_task = line[len(_TASK_PREFIX):].strip()
+            elif startswith(line, _CRITERIA_PREFIX):
+                completion_criteria = line[len(_CRITERIA_PREFIX):].strip()
+            elif startswith(line, _FILES_PREFIX):
+                working_files = line[len(_FILES_PREFIX):].strip()
+            elif startswith(line, _INTEGRATION_PREFIX):
+                integration_points = line[len(_INTEGRATION_PREFIX):].strip()
+        if custom_focus:
+            current_task = custom_focus
+
         # Extract completed tasks
-        completed_tasks = []
-        completed_section = re.search(r"## Completed\n(.*?)(?=\n##|\Z)", state, re.DOTALL)
-        if completed_section:
-            for line in completed_section.group(1).strip().split("\n"):
-                if line.startswith("- "):
-                    completed_tasks.append(line[2:].strip())
+        completed_section = state_sections.get("Completed")
+        completed_tasks = _parse_bullets(completed_section) if completed_section else []
         completed_info = ", ".join(completed_tasks[-3:])  # Last 3 completed tasks
-        
+
         # Extract next tasks
         next_tasks = []
-        next_section = re.search(r"## Next Tasks\n(.*?)(?=\n##|\Z)", state, re.DOTALL)
+        next_section = state_sections.get("Next Tasks")
         if next_section:
-            for line in next_section.group(1).strip().split("\n"):
-                if re.match(r"^\d+\.\s", line):
-                    task_name = re.sub(r"^\d+\.\s", "", line).strip()
-                    next_tasks.append(task_name)
+            append = next_tasks.append
+            strip_numbered = _strip_numbered
+            for line in next_section.splitlines():
+                task_name = strip_numbered(line)
+                if task_name is not None:
+                    append(task_name)
         next_info = ", ".join(next_tasks[:3])  # Next 3 tasks
-        
+
         # Extract challenges
-        challenges = []
-        challenge_section = re.search(r"## Challenges\n(.*?)(?=\n##|\Z)", state, re.DOTALL)
-        if challenge_section and "None yet" not in challenge_section.group(1):
-            for line in challenge_section.group(1).strip().split("\n"):
-                if line.startswith("- "):
-                    challenge_name = line[2:].split(":")[0].strip()
-                    challenges.append(challenge_name)
+        challenge_section = state_sections.get("Challenges")
+        if challenge_section and "None yet" not in challenge_section:
+            challenges = _parse_bullet_names(challenge_section)
+        else:
+            challenges = []
         challenge_info = ", ".join(challenges) if challenges else "None identified"
-        
+
         # Extract recent decisions
-        decisions = []
-        decision_section = re.search(r"## Decisions\n(.*?)(?=\n##|\Z)", state, re.DOTALL)
-        if decision_section:
-            for line in decision_section.group(1).strip().split("\n"):
-                if line.startswith("- "):
-                    decision_name = line[2:].split(":")[0].strip()
-                    decisions.append(decision_name)
+        decision_section = state_sections.get("Decisions")
+        decisions = _parse_bullet_names(decision_section) if decision_section else []
         decision_info = ", ".join(decisions[-2:]) if decisions else "No recent decisions"
         
         # Create new prompt
-        prompt = f"""Continue developing the project focusing on the following task:
-
-## Current Focus
-- Task: {current_task}
-- Files: {working_files}
-- Integration points: {integration_points}
-- Completion criteria: {completion_criteria}
-
-## Project Context
-- Project: {project_info}
-- Current phase: {phase_info}
-- Progress: {progress}% complete
-- Key architecture: {arch_info}
-- Development principles: {principles_info}
-
-## Current State
-- Completed: {completed_info}
-- Next tasks: {next_info}
-- Challenges: {challenge_info}
-- Recent decisions: {decision_info}
-
-## Implementation Requirements
-1. The implementation should follow the project's development principles
-2. Code should be properly documented with comments
-3. Handle edge cases and potential errors
-4. Integrate well with existing components
-5. Be testable and maintainable
-
-Please provide:
-1. Implementation code for the current task including:
-   - File paths and full implementation code
-   - Any necessary changes to dependent files
-   - Clear comments explaining key functionality
-
-2. Updated task status for development-state.md:
-   - Brief description of implementation approach
-   - Key implementation details to document
-   - Next logical task to tackle
-
-3. Any architecture updates needed
-
-4. Verification approach:
-   - How to verify the implementation works correctly
-   - Edge cases to test
-   - Integration test approach if applicable
-"""
-        
-        # Write new prompt
-        with open(self.prompt_file, "w") as f:
-            f.write(prompt)
+        prompt = _PROMPT_TEMPLATE.format_map({
+            "current_task": current_task,
+            "working_files": working_files,
+            "integration_points": integration_points,
+            "completion_criteria": completion_criteria,
+            "project_info": project_info,
+            "phase_info": phase_info,
+            "progress": progress,
+            "arch_info": arch_info,
+            "principles_info": principles_info,
+            "completed_info": completed_info,
+            "next_info": next_info,
+            "challenge_info": challenge_info,
+            "decision_info": decision_info,
+        })
+
+
+        # Write new prompt and remember what it was generated from. A custom
+        # focus produces a prompt the cache doesn't describe, so drop the
+        # sidecar to force the next bare run to regenerate.
+        _write_file(self.prompt_file, prompt)
+        if custom_focus is None:
+            _write_file(self.cache_file, json.dumps(cache_key))
+        else:
+            try:
+                os.remove(self.cache_file)
+            except OSError:
+                pass
         
         print(f"✅ Updated prompt for task: {current_task}")
         print(f"   Prompt saved to {self.prompt_file}")
@@ -338,75 +481,47 @@ Please provide:
     def update_state(self, task_completed=None, next_task=None, criteria=None, files=None, integration=None, reset=False):
         """Update the development state file with completed and next tasks."""
         # Check if file exists
-        if not os.path.exists(self.state_file):
+        if not self.state_file.exists():
             print("⚠️  Error: State file not found. Run 'init' first.")
             return
         
         # Read state file
-        with open(self.state_file, "r") as f:
-            state_content = f.read()
+        state_content = _read_file(self.state_file)
         
         # If reset is requested, reset the state file
         if reset:
             # Keep only the structure
-            state_content = """# Development State
-
-## High Priority
-- CURRENT TASK: Initialize phase
-- COMPLETION CRITERIA: Phase initialization complete
-- WORKING FILES: Initial phase files
-- INTEGRATION POINTS: None yet
-
-## Completed
-- Previous phase completion
+            state_content = _RESET_STATE_TEMPLATE
 
-## Next Tasks
-1. First task in new phase
-   - Files: To be determined
-   - Integration: To be determined
 
-## Challenges
-- None yet
-
-## Decisions
-- Phase transition
-  - Rationale: Previous phase completed
-  - Alternatives: Continue previous phase
-"""
-        
-        # Update completed tasks
-        if task_completed:
-            # Extract current task
+        # Apply all field updates and the completed-entry insertion in a
+        # single pass over the parsed lines
+        if task_completed or next_task:
+            lines = state_content.split("\n")
             current_task = "implementation"
-            task_match = re.search(r"- CURRENT TASK: (.*?)(?=\n|-|\Z)", state_content, re.DOTALL)
-            if task_match:
-                current_task = task_match.group(1).strip()
-            
-            # Add to completed section
-            completed_pattern = r"(## Completed\n)"
-            completed_replacement = f"\\1- {current_task}: {task_completed}\n"
-            state_content = re.sub(completed_pattern, completed_replacement, state_content)
-        
-        # Update current task
-        if next_task:
-            # Update the CURRENT TASK
-            state_content = re.sub(r"- CURRENT TASK: .*?\n", f"- CURRENT TASK: {next_task}\n", state_content)
-            
-            # Update completion criteria if provided
-            if criteria:
-                state_content = re.sub(r"- COMPLETION CRITERIA: .*?\n", f"- COMPLETION CRITERIA: {criteria}\n", state_content)
-            
-            # Update working files if provided
-            if files:
-                state_content = re.sub(r"- WORKING FILES: .*?\n", f"- WORKING FILES: {files}\n", state_content)
-            
-            # Update integration points if provided
-            if integration:
-                state_content = re.sub(r"- INTEGRATION POINTS: .*?\n", f"- INTEGRATION POINTS: {integration}\n", state_content)
+            startswith = str.startswith  # local binding skips per-line lookups
+            i = 0
+            while i < len(lines):
+                line = lines[i]
+                if startswith(line, _TASK_PREFIX):
+                    # Remember the outgoing task for the completed entry
+                    current_task = line[len(_TASK_PREFIX):].strip()
+                    if next_task:
+                        lines[i] = _TASK_PREFIX + next_task
+                elif next_task and criteria and startswith(line, _CRITERIA_PREFIX):
+                    lines[i] = _CRITERIA_PREFIX + criteria
+                elif next_task and files and startswith(line, _FILES_PREFIX):
+                    lines[i] = _FILES_PREFIX + files
+                elif next_task and integration and startswith(line, _INTEGRATION_PREFIX):
+                    lines[i] = _INTEGRATION_PREFIX + integration
+                elif task_completed and line == _COMPLETED_HEADER:
+                    lines.insert(i + 1, f"- {current_task}: {task_completed}")
+                    i += 1
+                i += 1
+            state_content = "\n".join(lines)
         
         # Write updated state
-        with open(self.state_file, "w") as f:
-            f.write(state_content)
+        _write_file(self.state_file, state_content)
         
         action = "Reset" if reset else "Updated"
         print(f"✅ {action} development state")
@@ -418,32 +533,63 @@ Please provide:
     def update_phase(self, new_phase=None, progress=None):
         """Update the project phase in the context file."""
         # Check if file exists
-        if not os.path.exists(self.context_file):
+        if not self.context_file.exists():
             print("⚠️  Error: Context file not found. Run 'init' first.")
             return
         
         # Read context file
-        with open(self.context_file, "r") as f:
-            context_content = f.read()
+        context_content = _read_file(self.context_file)
         
         # Update phase if provided
         if new_phase:
-            context_content = re.sub(r"## Current Phase: .*?\n", f"## Current Phase: {new_phase}\n", context_content)
-        
+            context_content = _replace_line(context_content, _PHASE_PREFIX, new_phase)
+
         # Update progress if provided
         if progress:
-            context_content = re.sub(r"Progress: .*?%", f"Progress: {progress}%", context_content)
+            idx = context_content.find(_PROGRESS_PREFIX)
+            if idx != -1:
+                # Stay within the located line so a malformed value can't
+                # splice up to a "%" later in the file
+                end = context_content.find("\n", idx)
+                if end == -1:
+                    end = len(context_content)
+                pct = context_content.find("%", idx, end)
+                if pct != -1:
+                    context_content = (
+                        context_content[:idx] + _PROGRESS_PREFIX + progress + context_content[pct:]
+                    )
         
         # Write updated context
-        with open(self.context_file, "w") as f:
-            f.write(context_content)
+        _write_file(self.context_file, context_content)
         
         print(f"✅ Updated project phase: {new_phase}")
         if progress:
             print(f"   Progress: {progress}%")
 
+# Command dispatch table: one dict lookup instead of an if/elif chain
+_COMMANDS = {
+    "init": lambda args: RecursiveDevKit().init(
+        args.project_name, args.description, args.phases, args.initial_phase),
+    "prompt": lambda args: RecursiveDevKit().update_prompt(args.focus),
+    "state": lambda args: RecursiveDevKit().update_state(
+        args.completed, args.next, args.criteria, args.files, args.integration, args.reset),
+    "phase": lambda args: RecursiveDevKit().update_phase(args.new, args.progress),
+}
+
+
 def main():
     """Main entry point for the CLI."""
+    # Fast paths: answer --version and a bare "prompt" without paying for
+    # argparse setup
+    if len(sys.argv) >= 2 and sys.argv[1] == "--version":
+        print(f"{os.path.basename(sys.argv[0])} {VERSION}")
+        return
+    if sys.argv[1:] == ["prompt"]:
+        RecursiveDevKit().update_prompt(None)
+        return
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="RecursiveDevKit - Framework for AI-assisted development",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -485,17 +631,10 @@ Examples:
     phase_parser.add_argument("--progress", help="Phase progress percentage (without %)")
     
     args = parser.parse_args()
-    
-    devkit = RecursiveDevKit()
-    
-    if args.command == "init":
-        devkit.init(args.project_name, args.description, args.phases, args.initial_phase)
-    elif args.command == "prompt":
-        devkit.update_prompt(args.focus)
-    elif args.command == "state":
-        devkit.update_state(args.completed, args.next, args.criteria, args.files, args.integration, args.reset)
-    elif args.command == "phase":
-        devkit.update_phase(args.new, args.progress)
+
+    handler = _COMMANDS.get(args.command)
+    if handler:
+        handler(args)
     else:
         parser.print_help()
 